@@ -3,7 +3,7 @@
 Terminal Rubik's Cube timer (scramble feature removed).
 
 Features:
- - Space: start / stop (when stopping, append the solve to `solves.json`)
+ - Space: start / stop (when stopping, append the solve to `solves.jsonl`)
  - i: 15s inspection (press Space during inspection to start early)
  - r: reset in-memory solves
  - s: save solves to CSV (export)
@@ -11,7 +11,11 @@ Features:
  - q: quit
 
 Behavior:
- - Every completed solve is appended to `solves.json` stored next to this script.
+ - Every completed solve is appended to `solves.jsonl` (one JSON record per line)
+   stored next to this script. A legacy `solves.json` array is migrated on first load.
+ - Writes are batched: pending solves are flushed every 5 solves or 30s, and on
+   quit, Ctrl-C, SIGTERM or SIGHUP (closing the terminal). A hard kill (SIGKILL,
+   power loss) can lose the solves of the current unflushed batch.
  - The main UI shows a live clock and elapsed time on a single status line.
 """
 
@@ -20,9 +24,9 @@ from __future__ import annotations, print_function
 import csv
 import json
 import os
+import signal
 import sys
 import time
-from statistics import mean
 from typing import List, Optional
 
 try:
@@ -35,6 +39,21 @@ except Exception:
     # colorama not available -> fall back to no-color
     COLOR_AVAILABLE = False
 
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+except ImportError:
+    # orjson not available -> fall back to the stdlib json module
+
+    def _dumps(obj) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+    _loads = json.loads
+
 # Color helpers (safe without colorama)
 if COLOR_AVAILABLE:
     C = Fore.LIGHTCYAN_EX
@@ -78,11 +97,25 @@ def colored_output(text: str, typ: str = "info") -> None:
 
 # Cross-platform single-key reader with timeout
 if os.name == "nt":
+    import ctypes
     import msvcrt
 
+    _kernel32 = ctypes.windll.kernel32
+    # explicit signatures: the default int restype would truncate 64-bit HANDLEs
+    _kernel32.GetStdHandle.argtypes = (ctypes.c_uint32,)
+    _kernel32.GetStdHandle.restype = ctypes.c_void_p
+    _kernel32.WaitForSingleObject.argtypes = (ctypes.c_void_p, ctypes.c_uint32)
+    _kernel32.WaitForSingleObject.restype = ctypes.c_uint32
+    _kernel32.FlushConsoleInputBuffer.argtypes = (ctypes.c_void_p,)
+    _kernel32.FlushConsoleInputBuffer.restype = ctypes.c_int
+    _STDIN_HANDLE = _kernel32.GetStdHandle(-10)  # STD_INPUT_HANDLE (DWORD -10)
+    _WAIT_OBJECT_0 = 0
+    _WAIT_TIMEOUT = 0x102
+    _INFINITE = 0xFFFFFFFF
+
     def getkey(timeout: Optional[float] = None) -> Optional[str]:
         """Return a single character string or None on timeout."""
-        start = time.time()
+        start = time.perf_counter()
         while True:
             if msvcrt.kbhit():
                 ch = msvcrt.getch()
@@ -95,9 +128,28 @@ if os.name == "nt":
                     return ch.decode("utf-8", errors="ignore")
                 except Exception:
                     return ""
-            if timeout is not None and (time.time() - start) >= timeout:
-                return None
-            time.sleep(0.01)
+
+            if timeout is None:
+                wait_ms = _INFINITE
+            else:
+                remaining = timeout - (time.perf_counter() - start)
+                if remaining <= 0:
+                    return None
+                wait_ms = max(1, round(remaining * 1000))
+
+            # block until a console input event arrives (or the timeout expires)
+            result = _kernel32.WaitForSingleObject(_STDIN_HANDLE, wait_ms)
+            if result == _WAIT_OBJECT_0:
+                if msvcrt.kbhit():
+                    continue
+                # woken by a non-key event (mouse, focus, key release) -> drop it,
+                # otherwise the handle stays signaled and we would spin
+                if not _kernel32.FlushConsoleInputBuffer(_STDIN_HANDLE):
+                    # stdin is not a console (redirected/piped) -> poll instead
+                    time.sleep(0.01)
+            elif result != _WAIT_TIMEOUT:
+                # WAIT_FAILED etc. -> fall back to the old polling interval
+                time.sleep(0.01)
 
 else:
     import select
@@ -109,35 +161,49 @@ else:
         fd = sys.stdin.fileno()
         old = termios.tcgetattr(fd)
         try:
-            tty.setraw(fd)
+            # TCSANOW: keep keys typed between calls (the default TCSAFLUSH drops them)
+            tty.setraw(fd, termios.TCSANOW)
             if timeout is None:
                 rlist, _, _ = select.select([fd], [], [])
             else:
                 rlist, _, _ = select.select([fd], [], [], timeout)
             if rlist:
-                ch = sys.stdin.read(1)
-                return ch
+                # read the fd directly: sys.stdin's buffer would swallow any
+                # further queued keys and hide them from select()
+                return os.read(fd, 1).decode("utf-8", errors="ignore")
             return None
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old)
 
 
 # Utilities
+# (seconds, formatted) of the last format_time call; the idle display asks for
+# the same value on every redraw. Keyed on the exact value because the chosen
+# format depends on it (59.9996 -> "60.000" but 60.0 -> "1:00.000").
+_LAST_FMT = (None, "")
+
+
 def format_time(t: float) -> str:
-    minutes = int(t // 60)
-    seconds = t % 60
-    if minutes:
-        return f"{minutes}:{seconds:06.3f}"
+    global _LAST_FMT
+
+    if t == _LAST_FMT[0]:
+        return _LAST_FMT[1]
+
+    if t < 60:
+        formatted = f"{t:06.3f}"
     else:
-        return f"{seconds:06.3f}"
+        minutes = int(t // 60)
+        seconds = t % 60
+        formatted = f"{minutes}:{seconds:06.3f}"
 
+    _LAST_FMT = (t, formatted)
+    return formatted
 
-def ao5():
-    if os.path.exists("solves.json"):
-        with open("solves.json", "r") as solves_json:
-            solves = json.load(solves_json)
 
-        last5 = solves[-5:]
+def ao5():
+    # only the in-memory tail is touched; never re-reads the solves file
+    if len(_SOLVES_CACHE) >= 5:
+        last5 = _SOLVES_CACHE[-5:]
 
         mean_value = 0.0
 
@@ -149,23 +215,14 @@ def ao5():
         return mean_value
 
 
-def print_stats(times: List[float]) -> None:
-    if not os.path.exists("solves.json"):
+def print_stats() -> None:
+    if not _COUNT:
         colored_output("No solves yet.", "info")
         return
 
-    else:
-        times = []
-
-        with open("solves.json", "r") as solves_json:
-            solves = json.load(solves_json)
-
-        for solve in solves:
-            times.append(solve["seconds"])
-
-    best = min(times)
-    worst = max(times)
-    avg_all = mean(times)
+    best = _BEST
+    worst = _WORST
+    avg_all = _SUM / _COUNT
     ao5_val = ao5()
 
     # colored_output(
@@ -173,7 +230,7 @@ def print_stats(times: List[float]) -> None:
     #    "info",
     # )
 
-    colored_output(f"Solves:       {'{:>8}'.format(len(times))}", "info")
+    colored_output(f"Solves:       {'{:>8}'.format(_COUNT)}", "info")
     colored_output(
         f"{GREEN}Best:{RESET}         {'{:>8}'.format(format_time(best))}", "info"
     )
@@ -190,95 +247,241 @@ def print_stats(times: List[float]) -> None:
     # print("")
 
 
-# JSON append helper
+# JSON Lines storage helpers
 SCRIPT_DIR = os.path.abspath(os.path.dirname(__file__))
-SOLVES_JSON = os.path.join(SCRIPT_DIR, "solves.json")
+SOLVES_JSON = os.path.join(SCRIPT_DIR, "solves.jsonl")
+LEGACY_SOLVES_JSON = os.path.join(SCRIPT_DIR, "solves.json")
+
+# In-memory copy of every stored solve; loaded once in main() and kept in
+# sync by append_solve_json() so stats/list never re-parse the file.
+_SOLVES_CACHE: List[dict] = []
+
+# Running aggregates over `_SOLVES_CACHE`, updated on every append.
+_BEST = float("inf")
+_WORST = float("-inf")
+_SUM = 0.0
+_COUNT = 0
 
+# Records not yet written to disk; flushed in one write by maybe_flush().
+_PENDING: List[dict] = []
+_LAST_FLUSH = time.perf_counter()
+FLUSH_EVERY_SOLVES = 5
+FLUSH_EVERY_SECONDS = 30.0
 
-def append_solve_json(
-    seconds: float, formatted: str, filename: str = SOLVES_JSON
-) -> None:
+
+def _migrate_legacy_json(filename: str = SOLVES_JSON) -> Optional[List[dict]]:
+    """
+    One-time conversion of the old `solves.json` array into JSON Lines.
+
+    Handles both a legacy `solves.json` next to the script and a `filename`
+    that still contains a JSON array (leading `[`).
+    Returns the legacy records if they could be read but not written back
+    (e.g. read-only directory), otherwise None.
     """
-    Append a solve record to a JSON array stored in `filename`.
+    try:
+        with open(filename, "rb") as f:
+            if f.read(1) != b"[":
+                return None
+        source = filename
+    except FileNotFoundError:
+        source = LEGACY_SOLVES_JSON
+
+    try:
+        with open(source, "rb") as f:
+            data = _loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        colored_output(f"Failed to migrate {source}: {e}", "error")
+        return None
+
+    if not isinstance(data, list):
+        data = []
+
+    tmp = filename + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.writelines(_dumps(record) for record in data)
+        os.replace(tmp, filename)
+    except OSError as e:
+        colored_output(f"Failed to migrate {source}: {e}", "error")
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        # keep working from the legacy array in memory
+        return data
+
+    return None
+
+
+def _read_solves(filename: str = SOLVES_JSON) -> List[dict]:
+    """Parse `filename` line by line; a missing file means no solves."""
+    try:
+        with open(filename, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return []
+
+    # bytes go straight to the JSON decoder, no TextIOWrapper decoding
+    solves: List[dict] = []
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            solves.append(_loads(line))
+        except ValueError:
+            # skip a torn/partial line (e.g. interrupted write)
+            continue
+    return solves
+
+
+def load_solves(filename: str = SOLVES_JSON) -> List[dict]:
+    """Return all solve records stored in `filename` (one JSON object per line)."""
+    legacy = _migrate_legacy_json(filename)
+    if legacy is not None:
+        return legacy
+    return _read_solves(filename)
+
+
+def _add_to_aggregates(seconds: float) -> None:
+    """Fold a single solve time into the running aggregates."""
+    global _BEST, _WORST, _SUM, _COUNT
+
+    _BEST = min(_BEST, seconds)
+    _WORST = max(_WORST, seconds)
+    _SUM += seconds
+    _COUNT += 1
+
+
+def _rebuild_aggregates() -> None:
+    """Recompute best/worst/sum/count from `_SOLVES_CACHE`."""
+    global _BEST, _WORST, _SUM, _COUNT
+
+    # single fused pass instead of separate min()/max()/sum() scans
+    best = float("inf")
+    worst = float("-inf")
+    total = 0.0
+    for solve in _SOLVES_CACHE:
+        t = solve["seconds"]
+        total += t
+        if t < best:
+            best = t
+        if t > worst:
+            worst = t
+
+    _BEST = best
+    _WORST = worst
+    _SUM = total
+    _COUNT = len(_SOLVES_CACHE)
+
+
+def reload_solves(filename: str = SOLVES_JSON) -> None:
+    """Replace the contents of `_SOLVES_CACHE` with the records on disk."""
+    _SOLVES_CACHE[:] = load_solves(filename)
+    _rebuild_aggregates()
+
+
+def append_solve_json(seconds: float, formatted: str) -> None:
+    """
+    Queue a solve record for the JSON Lines file `SOLVES_JSON`.
 
     A record:
-      {"timestamp": "2025-11-29T12:34:56Z", "seconds": 12.345678, "formatted": "12.345"}
+      {"timestamp": "2025-11-29 12:34:56", "seconds": 12.345678, "formatted": "12.345"}
 
-    If the file doesn't exist it will be created. If it contains invalid JSON, it's overwritten.
+    The record is added to `_SOLVES_CACHE` (and the running aggregates) right
+    away; it reaches the file once maybe_flush() decides to write the pending batch.
     """
     record = {
         "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
         "seconds": seconds,
         "formatted": formatted,
     }
+    _SOLVES_CACHE.append(record)
+    _PENDING.append(record)
+    _add_to_aggregates(seconds)
 
-    solves: List[dict] = []
-    try:
-        if os.path.exists(filename):
-            with open(filename, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    solves = data
-                else:
-                    # unexpected content -> start fresh
-                    solves = []
-    except Exception:
-        # on any read/parse error, start fresh
-        solves = []
+    maybe_flush()
 
-    solves.append(record)
 
-    # write atomically
-    tmp = filename + ".tmp"
+def maybe_flush(force: bool = False, filename: str = SOLVES_JSON) -> None:
+    """
+    Append all pending records to `filename` in a single write.
+
+    Only writes when forced, when `FLUSH_EVERY_SOLVES` records are pending or
+    when `FLUSH_EVERY_SECONDS` have passed since the last flush.
+    If the file doesn't exist it will be created.
+    """
+    global _LAST_FLUSH
+
+    if not _PENDING:
+        return
+    if not (
+        force
+        or len(_PENDING) >= FLUSH_EVERY_SOLVES
+        or time.perf_counter() - _LAST_FLUSH > FLUSH_EVERY_SECONDS
+    ):
+        return
+
     try:
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(solves, f, indent=2, ensure_ascii=False)
-        os.replace(tmp, filename)
+        with open(filename, "a+b") as f:
+            # terminate a torn last line (interrupted write) so the new
+            # records don't get glued onto it and dropped with it on load
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.writelines(_dumps(record) for record in _PENDING)
     except Exception as e:
-        # final fallback: try direct write
-        try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(solves, f, indent=2, ensure_ascii=False)
-        except Exception:
-            colored_output(f"Failed to save solve to JSON: {e}", "error")
+        colored_output(f"Failed to save solve to JSON: {e}", "error")
+        return
+
+    _PENDING.clear()
+    _LAST_FLUSH = time.perf_counter()
 
 
 # Status line helpers
-def shutil_terminal_width() -> Optional[int]:
-    try:
-        import shutil
+_STATUS_RUN = colored("RUNNING", ERR)
+_STATUS_RDY = colored("READY  ", C)
+_STATUS_PREFIX = f"{C}[*]{RESET} "
 
-        return shutil.get_terminal_size().columns
-    except Exception:
-        return None
+# ANSI "erase entire line" + carriage return (colorama handles it on Windows)
+_CLEAR_LINE = "\x1b[2K\r"
+
+# Last status line written; identical redraws are skipped.
+_LAST_LINE = ""
+
+
+def invalidate_status_line() -> None:
+    """Force the next write_status_line to redraw (e.g. after other output)."""
+    global _LAST_LINE
+    _LAST_LINE = ""
 
 
 def clear_status_line() -> None:
-    width = shutil_terminal_width() or 120
-    sys.stdout.write("\r" + " " * width + "\r")
+    invalidate_status_line()
+    sys.stdout.write(_CLEAR_LINE)
     sys.stdout.flush()
 
 
 def write_status_line(running: bool, elapsed_display: str, extra: str = "") -> None:
-    if running:
-        status_seg = colored("RUNNING", ERR)
-    else:
-        status_seg = colored("READY  ", C)
+    global _LAST_LINE
+
+    status_seg = _STATUS_RUN if running else _STATUS_RDY
     elapsed_seg = colored(elapsed_display, RESET)
-    line = f"{C}[*]{RESET} {status_seg} | {elapsed_seg} {extra}"
-    width = shutil_terminal_width() or 120
-    sys.stdout.write("\r" + " " * width + "\r")
-    sys.stdout.write(line)
+    line = f"{_STATUS_PREFIX}{status_seg} | {elapsed_seg} {extra}"
+    if line == _LAST_LINE:
+        return
+    _LAST_LINE = line
+    sys.stdout.write(_CLEAR_LINE + line)
     sys.stdout.flush()
 
 
 def list_solves():
-    if os.path.exists("solves.json"):
-        with open("solves.json", "r") as solves_json:
-            solves = json.load(solves_json)
-
-        worst = max(solve["seconds"] for solve in solves)
-        best = min(solve["seconds"] for solve in solves)
+    solves = _SOLVES_CACHE
+    if solves:
+        worst = _WORST
+        best = _BEST
 
         print("")
         print("")
@@ -302,7 +505,7 @@ def list_solves():
         print("")
         print("")
 
-        colored_output("No solves.json file found!", "error")
+        colored_output("No solves found!", "error")
 
         print("")
 
@@ -320,15 +523,39 @@ def help():
     print("")
 
 
+# Redraw cadence: the live clock is redrawn at ~30 Hz while running; when idle
+# the display is static, so only wake up occasionally (e.g. for maybe_flush).
+FRAME_INTERVAL = 1 / 30
+IDLE_INTERVAL = 0.5
+
+
+def _exit_on_signal(signum, frame) -> None:
+    # turn SIGTERM/SIGHUP into a normal exit so main()'s finally flushes
+    raise SystemExit(128 + signum)
+
+
 # Main loop
 def main() -> None:
-    os.system("clear")
+    # hot names bound as locals for the redraw loop
+    _now = time.perf_counter
+    _getkey = getkey
+    _fmt = format_time
+
+    # clear screen + cursor home, without forking /bin/clear
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
     times: List[float] = []
     running = False
     start_time: Optional[float] = None
     last_elapsed = 0.0
 
+    reload_solves()
+
+    for name in ("SIGTERM", "SIGHUP"):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), _exit_on_signal)
+
     colored_output("Simple Rubik's Cube Timer", "title")
     colored_output("-------------------------", "title")
     print("")
@@ -338,45 +565,45 @@ def main() -> None:
     try:
         while True:
             if running and start_time is not None:
-                elapsed = time.time() - start_time
-                elapsed_display = format_time(elapsed)
+                elapsed = _now() - start_time
+                elapsed_display = _fmt(elapsed)
             else:
-                elapsed_display = (
-                    format_time(last_elapsed) if last_elapsed else "00.000"
-                )
+                elapsed_display = _fmt(last_elapsed) if last_elapsed else "00.000"
 
             write_status_line(running, elapsed_display)
 
-            key = getkey(timeout=0.12)
+            key = _getkey(timeout=FRAME_INTERVAL if running else IDLE_INTERVAL)
             if key is None:
+                maybe_flush()
                 continue
 
+            # anything printed below moves the cursor off the status line
+            invalidate_status_line()
+
             # Normalize keys
             if key == " ":
                 if not running:
                     # start timer
                     running = True
-                    start_time = time.time()
+                    start_time = _now()
                     write_status_line(running, "00.000")
                 else:
                     # stop timer
-                    elapsed = (
-                        time.time() - start_time if start_time is not None else 0.0
-                    )
+                    elapsed = _now() - start_time if start_time is not None else 0.0
                     running = False
                     start_time = None
                     last_elapsed = elapsed
                     times.append(elapsed)
 
-                    # Append this solve to the JSON file immediately
-                    append_solve_json(elapsed, format_time(elapsed))
+                    # Queue this solve for the JSON Lines file
+                    append_solve_json(elapsed, _fmt(elapsed))
 
                     clear_status_line()
-                    colored_output(f"Stopped > {format_time(elapsed)}", "info")
+                    colored_output(f"Stopped > {_fmt(elapsed)}", "info")
 
                     print("")
 
-                    print_stats(times)
+                    print_stats()
 
                     # colored_output("Press Space to start...", "input")
 
@@ -384,16 +611,16 @@ def main() -> None:
 
             elif key in ("i", "I"):
                 # Inspection: 15s countdown, auto-start after (or Space to start early)
-                inspect_start = time.time()
+                inspect_start = _now()
                 remaining = 15.0
                 started_early = False
                 while remaining > 0:
-                    remaining = 15.0 - (time.time() - inspect_start)
+                    remaining = 15.0 - (_now() - inspect_start)
                     if remaining < 0:
                         remaining = 0.0
                     extra = colored(f"[{remaining:04.2f}s]", Y)
                     write_status_line(False, "00.000", extra=extra)
-                    k = getkey(timeout=0.12)
+                    k = _getkey(timeout=min(FRAME_INTERVAL, remaining))
                     if k == " ":
                         started_early = True
                         break
@@ -401,12 +628,12 @@ def main() -> None:
                 clear_status_line()
                 if started_early:
                     running = True
-                    start_time = time.time()
+                    start_time = _now()
                     write_status_line(running, "00.000")
                     continue
 
                 running = True
-                start_time = time.time()
+                start_time = _now()
                 write_status_line(running, "00.000")
 
             elif key in ("r", "R"):
@@ -421,11 +648,14 @@ def main() -> None:
                 # Export to CSV (snapshot of current in-memory solves)
                 fname = os.path.join(SCRIPT_DIR, f"solves_{int(time.time())}.csv")
                 try:
-                    with open(fname, "w", newline="", encoding="utf-8") as csvfile:
+                    with open(
+                        fname, "w", newline="", encoding="utf-8", buffering=1 << 20
+                    ) as csvfile:
                         writer = csv.writer(csvfile)
                         writer.writerow(["index", "seconds", "formatted"])
-                        for i, t in enumerate(times, 1):
-                            writer.writerow([i, f"{t:.6f}", format_time(t)])
+                        writer.writerows(
+                            (i, f"{t:.6f}", _fmt(t)) for i, t in enumerate(times, 1)
+                        )
                     clear_status_line()
                     colored_output(f"Saved {len(times)} solves to {fname}", "info")
                 except Exception as e:
@@ -434,7 +664,7 @@ def main() -> None:
 
             elif key in ("a", "A"):
                 clear_status_line()
-                print_stats(times)
+                print_stats()
 
             elif key in ("q", "Q", "\x03", "\x04"):
                 clear_status_line()
@@ -455,6 +685,10 @@ def main() -> None:
         clear_status_line()
         colored_output("\nInterrupted; exiting.", "error")
 
+    finally:
+        # however the loop ends, don't lose queued solves
+        maybe_flush(force=True)
+
 
 if __name__ == "__main__":
     main()